@@ -1,81 +1,198 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import sqlite3
-import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+# pyarrow builds columnar buffers without boxing a Python object per cell;
+# fall back to plain pandas construction when it isn't installed
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 # Constants
 API_URL = "https://www.googleapis.com/books/v1/volumes"
 DB_FILE = "books.db"
 
+# Shared HTTP session: reuses the TCP/TLS connection across searches and
+# retries rate-limit/server errors with exponential backoff
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=2,
+        status_forcelist=[403, 429, 500, 502, 503, 504],
+        respect_retry_after_header=True
+    )
+))
 
-# Function to fetch books from Google Books API
-def fetch_books(query, max_results=40):
-    params = {"q": query, "maxResults": max_results}
-    retries = 3
-    for _ in range(retries):
-        response = requests.get(API_URL, params=params)
-        if response.status_code == 200:
-            return response.json().get("items", [])
-        elif response.status_code == 403:
-            st.warning("API request limit reached. Retrying in 10 seconds...")
-            time.sleep(10)
-        else:
-            st.error(f"Error fetching data: {response.status_code}")
-            return []
-    return []
 
+# Function to fetch books from Google Books API (memoized per query text).
+# The API caps maxResults at 40, so more results mean paged startIndex
+# requests; the pages are I/O-bound and fetched concurrently. Failures
+# raise instead of returning [], so st.cache_data never memoizes a
+# transient error as "no books found".
+@st.cache_data(ttl=3600)
+def fetch_books(query, pages=1):
+    def _fetch_page(start):
+        params = {"q": query, "maxResults": 40, "startIndex": start}
+        response = _session.get(API_URL, params=params, timeout=5)
+        response.raise_for_status()
+        return response.json().get("items", [])
 
-# Function to transform API data into a DataFrame
-def transform_data(books):
-    data = []
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        page_items = list(ex.map(_fetch_page, range(0, pages * 40, 40)))
+    return list(chain.from_iterable(page_items))
+
+
+# Column order matches the books table schema
+COLUMNS = (
+    "book_id", "title", "subtitle", "authors", "author_count", "description", "categories",
+    "page_count", "language", "image_link", "average_rating", "ratings_count",
+    "publisher", "published_year", "is_ebook", "saleability",
+    "amount_list_price", "currency_code_list_price", "amount_retail_price",
+    "currency_code_retail_price", "buy_link", "country"
+)
+
+
+# Function to stream API items as tuples in schema order, so the insert
+# path can skip the DataFrame round-trip entirely
+def iter_rows(books):
     for book in books:
-        volume_info = book.get("volumeInfo", {})
-        sale_info = book.get("saleInfo", {})
+        volume_info = book.get("volumeInfo", {}) or {}
+        sale_info = book.get("saleInfo", {}) or {}
         list_price = sale_info.get("listPrice", {})
         retail_price = sale_info.get("retailPrice", {})
+        image_links = volume_info.get("imageLinks", {})
 
-        published_date = volume_info.get("publishedDate", "Unknown")
-        published_year = "Unknown"
+        published_date = volume_info.get("publishedDate", "")
+        published_year = None
         if isinstance(published_date, str) and len(published_date) >= 4 and published_date[:4].isdigit():
-            published_year = published_date[:4]
-
-        data.append({
-            "book_id": book.get("id"),
-            "title": volume_info.get("title", "N/A"),
-            "subtitle": volume_info.get("subtitle", "N/A"),
-            "authors": ", ".join(volume_info.get("authors", ["Unknown Author"])) or "Unknown Author",
-            "description": volume_info.get("description", "No description available."),
-            "categories": ", ".join(volume_info.get("categories", ["N/A"])) or "N/A",
-            "page_count": volume_info.get("pageCount", 0),
-            "language": volume_info.get("language", "Unknown"),
-            "image_link": volume_info.get("imageLinks", {}).get("thumbnail", ""),
-            "average_rating": volume_info.get("averageRating", 0),
-            "ratings_count": volume_info.get("ratingsCount", 0),
-            "publisher": volume_info.get("publisher", "Unknown Publisher"),
-            "published_year": published_year,
-            "is_ebook": 1 if sale_info.get("isEbook", False) else 0,  # Fixed as 1 or 0
-            "saleability": sale_info.get("saleability", "Not for Sale"),
-            "amount_list_price": list_price.get("amount", 0),
-            "currency_code_list_price": list_price.get("currencyCode", ""),
-            "amount_retail_price": retail_price.get("amount", 0),
-            "currency_code_retail_price": retail_price.get("currencyCode", ""),
-            "buy_link": sale_info.get("buyLink", ""),
-            "country": sale_info.get("country", "N/A")
-        })
-    return pd.DataFrame(data)
+            published_year = int(published_date[:4])
+
+        authors = volume_info.get("authors") or []
+
+        yield (
+            book.get("id"),
+            volume_info.get("title", "N/A"),
+            volume_info.get("subtitle", "N/A"),
+            ", ".join(authors) or "Unknown Author",
+            len(authors),
+            volume_info.get("description", "No description available."),
+            ", ".join(volume_info.get("categories", ["N/A"])) or "N/A",
+            volume_info.get("pageCount", 0),
+            volume_info.get("language", "Unknown"),
+            image_links.get("thumbnail", ""),
+            volume_info.get("averageRating", 0),
+            volume_info.get("ratingsCount", 0),
+            volume_info.get("publisher", "Unknown Publisher"),
+            published_year,
+            1 if sale_info.get("isEbook", False) else 0,  # Fixed as 1 or 0
+            sale_info.get("saleability", "Not for Sale"),
+            list_price.get("amount", 0),
+            list_price.get("currencyCode", ""),
+            retail_price.get("amount", 0),
+            retail_price.get("currencyCode", ""),
+            sale_info.get("buyLink", ""),
+            sale_info.get("country", "N/A")
+        )
+
+
+# Compact dtypes for frames built in pandas: small ints/floats for the
+# numerics and category codes for the low-cardinality strings ("en",
+# "USD", "FOR_SALE", ...), instead of 8-byte objects per cell
+DTYPES = {
+    "page_count": "int32",
+    "is_ebook": "int8",
+    "average_rating": "float32",
+    "ratings_count": "int32",
+    "amount_list_price": "float32",
+    "amount_retail_price": "float32",
+    "language": "category",
+    "currency_code_list_price": "category",
+    "currency_code_retail_price": "category",
+    "saleability": "category",
+    "country": "category"
+}
+
+# The 20 canned analytics, frozen as (title, sql, renderer). "metric" marks
+# the single-row answers so the sidebar picks its renderer without
+# inspecting the result shape at click time.
+QUERIES = (
+    ("Availability of eBooks vs Physical Books", "SELECT CASE WHEN is_ebook = 1 THEN 'eBook' ELSE 'Physical Book' END AS book_type, COUNT(*) AS count FROM books GROUP BY is_ebook", "table"),
+    ("Publisher with Most Books Published", "SELECT publisher, book_count FROM publisher_stats ORDER BY book_count DESC LIMIT 1", "metric"),
+    ("Publisher with Highest Average Rating", "SELECT publisher, avg_rating FROM publisher_stats ORDER BY avg_rating DESC LIMIT 1", "metric"),
+    ("Top 5 Most Expensive Books", "SELECT title, amount_retail_price FROM books ORDER BY amount_retail_price DESC LIMIT 5", "table"),
+    ("Books Published After 2010 with at Least 500 Pages", "SELECT title, page_count FROM books WHERE published_year > 2010 AND page_count >= 500", "table"),
+    ("Books with Discounts Greater than 20%", "SELECT title, amount_list_price, amount_retail_price FROM books WHERE (amount_list_price - amount_retail_price) / amount_list_price > 0.2", "table"),
+    ("Top 3 Authors with Most Books", "SELECT authors, COUNT(*) AS book_count FROM books GROUP BY authors ORDER BY book_count DESC LIMIT 3", "table"),
+    ("Books with More than 3 Authors", "SELECT title, authors FROM books WHERE author_count > 3", "table"),
+    ("Books Published in the Last 5 Years", "SELECT title, published_year FROM books WHERE published_year >= CAST(strftime('%Y', 'now') AS INTEGER) - 5", "table"),
+    ("Top 3 Most Popular Books by Rating", "SELECT title, average_rating FROM books ORDER BY average_rating DESC LIMIT 3", "table"),
+    ("Top 5 Most Expensive eBooks", "SELECT title, amount_retail_price FROM books WHERE is_ebook = 1 ORDER BY amount_retail_price DESC LIMIT 5", "table"),
+    ("Top 5 Books by Ratings Count", "SELECT title, ratings_count FROM books ORDER BY ratings_count DESC LIMIT 5", "table"),
+    ("Books with Missing Descriptions", "SELECT title FROM books WHERE description = 'No description available.'", "table"),
+    ("Books with Missing Images", "SELECT title FROM books WHERE image_link = ''", "table"),
+    ("Books with a Rating Below 3", "SELECT title FROM books WHERE average_rating < 3", "table"),
+    ("Books by Publisher with the Most Ratings", "SELECT publisher, sum_ratings FROM publisher_stats ORDER BY sum_ratings DESC LIMIT 1", "metric"),
+    ("Books Over 1000 Pages", "SELECT title, page_count FROM books WHERE page_count > 1000", "table"),
+    ("Top 5 Books by Category", "SELECT categories, COUNT(*) FROM books GROUP BY categories ORDER BY COUNT(*) DESC LIMIT 5", "table"),
+    ("Top 3 Publishers with the Most eBooks", "SELECT publisher, COUNT(*) FROM books WHERE is_ebook = 1 GROUP BY publisher ORDER BY COUNT(*) DESC LIMIT 3", "table"),
+    ("Most Expensive Books by Publisher", "SELECT publisher, max_price FROM publisher_stats ORDER BY max_price DESC LIMIT 1", "metric")
+)
+TITLES = tuple(q[0] for q in QUERIES)
+
+
+# Function to transform API data into a DataFrame for the post-search
+# preview (the insert path feeds iter_rows straight to SQLite). With
+# concurrent paging a search can return hundreds of books, so prefer
+# pyarrow's columnar construction when available.
+def transform_data(books):
+    if pa is not None and books:
+        table = pa.Table.from_pylist([dict(zip(COLUMNS, row)) for row in iter_rows(books)])
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return pd.DataFrame.from_records(iter_rows(books), columns=COLUMNS).astype(DTYPES)
+
+
+# Function to apply SQLite speed settings on a connection. WAL keeps the
+# Details reads from blocking behind Search inserts (and vice versa), and
+# the big page cache plus mmap keep hot pages out of syscall territory.
+def apply_pragmas(conn):
+    conn.executescript('''
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA wal_autocheckpoint=1000;
+        PRAGMA cache_size=-131072;
+        PRAGMA mmap_size=268435456;
+        PRAGMA temp_store=MEMORY;
+    ''')
+
+
+# Cached connection shared across Streamlit reruns (PRAGMAs and page cache persist)
+@st.cache_resource
+def get_conn():
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+    apply_pragmas(conn)
+    return conn
 
 
 # Function to create or update database schema
 def initialize_database():
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute('''
+    schema = '''
         CREATE TABLE IF NOT EXISTS books (
             book_id TEXT PRIMARY KEY,
             title TEXT,
             subtitle TEXT,
             authors TEXT,
+            author_count INTEGER,
             description TEXT,
             categories TEXT,
             page_count INTEGER,
@@ -84,7 +201,7 @@ def initialize_database():
             average_rating REAL,
             ratings_count INTEGER,
             publisher TEXT,
-            published_year TEXT,
+            published_year INTEGER,
             is_ebook INTEGER,
             saleability TEXT,
             amount_list_price REAL,
@@ -94,23 +211,150 @@ def initialize_database():
             buy_link TEXT,
             country TEXT
         )
+    '''
+    cursor.execute(schema)
+    # Databases created before author_count existed get the column in place
+    declared = {row[1]: (row[2] or "").upper() for row in cursor.execute("PRAGMA table_info(books)")}
+    if "author_count" not in declared:
+        cursor.execute("ALTER TABLE books ADD COLUMN author_count INTEGER")
+    # Rows ingested before the column existed are NULL, which the
+    # author_count > 3 analytic would silently drop; backfill with the
+    # baseline comma count. A no-op (index probe) once everything is filled.
+    cursor.execute('''
+        UPDATE books
+        SET author_count = LENGTH(authors) - LENGTH(REPLACE(authors, ',', '')) + 1
+        WHERE author_count IS NULL AND authors IS NOT NULL
+    ''')
+    # Legacy schemas declared published_year TEXT. ALTER can't change a
+    # column's affinity, and integers stored into a TEXT column are
+    # converted back to text, so rebuild the table once with the current
+    # schema instead of casting rows in place. The legacy indexes go down
+    # with the old table and are recreated below.
+    if declared.get("published_year") == "TEXT":
+        select_cols = ", ".join(
+            "CASE WHEN published_year GLOB '[0-9]*' THEN CAST(published_year AS INTEGER) ELSE NULL END"
+            if name == "published_year" else name
+            for name in COLUMNS
+        )
+        cursor.execute("ALTER TABLE books RENAME TO books_legacy")
+        cursor.execute(schema)
+        cursor.execute(
+            "INSERT INTO books (" + ",".join(COLUMNS) + ") SELECT " + select_cols + " FROM books_legacy"
+        )
+        cursor.execute("DROP TABLE books_legacy")
+    # Indexes covering the columns the analytics queries filter/group/sort on,
+    # so they seek instead of scanning the whole table
+    cursor.executescript('''
+        CREATE INDEX IF NOT EXISTS ix_books_publisher ON books(publisher);
+        CREATE INDEX IF NOT EXISTS ix_books_ebook_price ON books(is_ebook, amount_retail_price DESC);
+        CREATE INDEX IF NOT EXISTS ix_books_year_pages ON books(published_year, page_count);
+        CREATE INDEX IF NOT EXISTS ix_books_rating ON books(average_rating);
+        CREATE INDEX IF NOT EXISTS ix_books_ratings_count ON books(ratings_count);
+        CREATE INDEX IF NOT EXISTS ix_books_categories ON books(categories);
+        CREATE INDEX IF NOT EXISTS ix_books_authorcount ON books(author_count);
+    ''')
+    # Per-publisher aggregates, refreshed after each insert so the analytics
+    # that only need publisher totals read a handful of rows instead of
+    # re-aggregating the whole books table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS publisher_stats (
+            publisher TEXT PRIMARY KEY,
+            book_count INTEGER,
+            avg_rating REAL,
+            sum_ratings INTEGER,
+            max_price REAL
+        )
     ''')
     conn.commit()
-    conn.close()
+    # A pre-existing database has books but no summary until the first
+    # Search; build it now so the publisher metrics aren't empty
+    if cursor.execute("SELECT 1 FROM publisher_stats LIMIT 1").fetchone() is None \
+            and cursor.execute("SELECT 1 FROM books LIMIT 1").fetchone() is not None:
+        refresh_publisher_stats(conn)
 
 
-# Function to save data to SQLite
-def save_to_database(conn, df):
-    df.to_sql("books", conn, if_exists="append", index=False)
+# Function to rebuild the publisher_stats summary from the books table
+def refresh_publisher_stats(conn):
+    conn.execute("BEGIN")
+    conn.execute("DELETE FROM publisher_stats")
+    conn.execute('''
+        INSERT INTO publisher_stats
+        SELECT publisher, COUNT(*), AVG(average_rating), SUM(ratings_count), MAX(amount_retail_price)
+        FROM books
+        GROUP BY publisher
+    ''')
+    conn.commit()
+
+
+# Function to save API items to SQLite in one transaction (avoids an fsync
+# per row and the pandas/to_sql binding overhead)
+def save_to_database(conn, books):
+    before = conn.total_changes
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT OR IGNORE INTO books (" + ",".join(COLUMNS) + ") "
+        "VALUES (" + ",".join(["?"] * len(COLUMNS)) + ")",
+        iter_rows(books)
+    )
+    conn.commit()
+    inserted = conn.total_changes - before  # Rows actually inserted (duplicates ignored)
+    refresh_publisher_stats(conn)
+    conn.execute("ANALYZE")  # Refresh planner statistics after the bulk insert
+    return inserted
+
 
+# Function to query the database (memoized by SQL string so reruns skip
+# SQLite; built straight off the cursor so the canned statements hit the
+# connection's prepared-statement cache instead of read_sql's introspection)
+@st.cache_data(ttl=600)
+def cached_query(sql, params=()):
+    cursor = get_conn().execute(sql, params)
+    df = pd.DataFrame(cursor.fetchall(), columns=[d[0] for d in cursor.description])
+    casts = {col: dtype for col, dtype in DTYPES.items() if col in df.columns}
+    if casts:
+        try:
+            df = df.astype(casts)
+        except (TypeError, ValueError):
+            pass  # NULL-heavy results stay at their inferred dtypes
+    return df
 
-# Function to query the database
-def query_database(conn, query):
-    return pd.read_sql_query(query, conn)
 
+# Function for small aggregate results: raw columns and rows off the cursor,
+# so one-line answers skip DataFrame construction entirely
+def scalar_query(sql):
+    cursor = get_conn().execute(sql)
+    cols = [d[0] for d in cursor.description]
+    return cols, cursor.fetchall()
 
-# Initialize database
+
+# Run the canned analytics once per process (cache_resource, not the
+# module body, since Streamlit re-executes the script on every rerun).
+# sqlite3's statement cache is keyed on exact SQL text, so this prepares
+# the statements exactly as later executed — but execute() also steps each
+# SELECT to its first row, a full scan/sort for the GROUP BY/ORDER BY
+# statements. The trade-off is deliberate: each query runs once up front,
+# validating the SQL and warming the statement and page caches before the
+# first click.
+@st.cache_resource
+def warm_statement_cache():
+    conn = get_conn()
+    for _, sql, _ in QUERIES:
+        conn.execute(sql)
+
+
+# Function to export the whole table as CSV, read in 1000-row chunks so the
+# full books table never has to sit in a single DataFrame
+@st.cache_data(ttl=600)
+def export_csv():
+    chunks = pd.read_sql_query("SELECT * FROM books", get_conn(), chunksize=1000)
+    return "".join(chunk.to_csv(index=False, header=(i == 0)) for i, chunk in enumerate(chunks))
+
+
+# Initialize database, grab the shared connection and pre-warm the
+# analytics statements (after the tables they reference exist)
 initialize_database()
+conn = get_conn()
+warm_statement_cache()
 
 # Streamlit UI
 st.set_page_config(page_title="BookScape Explorer", page_icon="📚", layout="wide")
@@ -121,60 +365,74 @@ st.sidebar.header("Search Books 🔍")
 
 # Search input (at the top of the sidebar)
 query = st.sidebar.text_input("Enter a search term", "Data Science")
+pages = st.sidebar.slider("Pages to fetch (40 books each)", 1, 10, 1)
 if st.sidebar.button("Search"):
     with st.spinner("Fetching books..."):
-        books = fetch_books(query)
+        try:
+            books = fetch_books(query, pages)
+        except requests.RequestException as e:
+            st.error(f"Error fetching data: {e}")
+            books = []
         if books:
-            df = transform_data(books)
-            conn = sqlite3.connect(DB_FILE)
-            save_to_database(conn, df)
-            st.success(f"Fetched and saved {len(df)} books to the database.")
+            inserted = save_to_database(conn, books)
+            cached_query.clear()  # New rows invalidate memoized results
+            export_csv.clear()
+            st.success(f"Fetched {len(books)} books; saved {inserted} new ones to the database.")
+            with st.expander("Preview fetched books"):
+                st.dataframe(transform_data(books), use_container_width=True)
         else:
             st.error("No books found. Please try a different search term.")
 
 # Dropdown for Data Analysis
 st.sidebar.subheader("📊 Data Analytics")
 
-# Define your 20 queries here
-queries = {
-    "Availability of eBooks vs Physical Books": "SELECT CASE WHEN is_ebook = 1 THEN 'eBook' ELSE 'Physical Book' END AS book_type, COUNT(*) AS count FROM books GROUP BY is_ebook",
-    "Publisher with Most Books Published": "SELECT publisher, COUNT(*) AS count FROM books GROUP BY publisher ORDER BY count DESC LIMIT 1",
-    "Publisher with Highest Average Rating": "SELECT publisher, AVG(average_rating) AS avg_rating FROM books GROUP BY publisher ORDER BY avg_rating DESC LIMIT 1",
-    "Top 5 Most Expensive Books": "SELECT title, amount_retail_price FROM books ORDER BY amount_retail_price DESC LIMIT 5",
-    "Books Published After 2010 with at Least 500 Pages": "SELECT title, page_count FROM books WHERE published_year > '2010' AND page_count >= 500",
-    "Books with Discounts Greater than 20%": "SELECT title, amount_list_price, amount_retail_price FROM books WHERE (amount_list_price - amount_retail_price) / amount_list_price > 0.2",
-    "Top 3 Authors with Most Books": "SELECT authors, COUNT(*) AS book_count FROM books GROUP BY authors ORDER BY book_count DESC LIMIT 3",
-    "Books with More than 3 Authors": "SELECT title, authors FROM books WHERE LENGTH(authors) - LENGTH(REPLACE(authors, ',', '')) + 1 > 3",
-    "Books Published in the Last 5 Years": "SELECT title, published_year FROM books WHERE published_year >= strftime('%Y', 'now') - 5",
-    "Top 3 Most Popular Books by Rating": "SELECT title, average_rating FROM books ORDER BY average_rating DESC LIMIT 3",
-    "Top 5 Most Expensive eBooks": "SELECT title, amount_retail_price FROM books WHERE is_ebook = 1 ORDER BY amount_retail_price DESC LIMIT 5",
-    "Top 5 Books by Ratings Count": "SELECT title, ratings_count FROM books ORDER BY ratings_count DESC LIMIT 5",
-    "Books with Missing Descriptions": "SELECT title FROM books WHERE description = 'No description available.'",
-    "Books with Missing Images": "SELECT title FROM books WHERE image_link = ''",
-    "Books with a Rating Below 3": "SELECT title FROM books WHERE average_rating < 3",
-    "Books by Publisher with the Most Ratings": "SELECT publisher, SUM(ratings_count) FROM books GROUP BY publisher ORDER BY SUM(ratings_count) DESC LIMIT 1",
-    "Books Over 1000 Pages": "SELECT title, page_count FROM books WHERE page_count > 1000",
-    "Top 5 Books by Category": "SELECT categories, COUNT(*) FROM books GROUP BY categories ORDER BY COUNT(*) DESC LIMIT 5",
-    "Top 3 Publishers with the Most eBooks": "SELECT publisher, COUNT(*) FROM books WHERE is_ebook = 1 GROUP BY publisher ORDER BY COUNT(*) DESC LIMIT 3",
-    "Most Expensive Books by Publisher": "SELECT publisher, MAX(amount_retail_price) FROM books GROUP BY publisher ORDER BY MAX(amount_retail_price) DESC LIMIT 1"
-}
-
 # Dropdown selection for analytics
-selected_query = st.sidebar.selectbox("Select Data Analysis", list(queries.keys()))
+selected_query = st.sidebar.selectbox("Select Data Analysis", TITLES)
 
-# Show the results of the selected query
+# Show the results of the selected query, dispatched by its annotated renderer
 if selected_query:
-    conn = sqlite3.connect(DB_FILE)
-    result = query_database(conn, queries[selected_query])
-    st.sidebar.write(result)
+    _, sql, renderer = QUERIES[TITLES.index(selected_query)]
+    if renderer == "metric":
+        cols, rows = scalar_query(sql)
+        if rows:
+            label = str(rows[0][0]) if len(cols) == 2 else cols[0]
+            st.sidebar.metric(label, rows[0][-1])
+    else:
+        st.sidebar.write(cached_query(sql))
 
-# Display book details with images
+# Display book details in a single table instead of widgets per row,
+# paginated in SQL so only the visible page leaves SQLite
 st.header("📚 Book Details 🚀")
-data = query_database(conn, "SELECT * FROM books")
+page_size = 25
+page = st.number_input("Page", min_value=1, step=1)
+data = cached_query(
+    "SELECT book_id, title, authors, description, categories, published_year, "
+    "average_rating, ratings_count, publisher, page_count, image_link, buy_link "
+    "FROM books ORDER BY book_id LIMIT ? OFFSET ?",
+    (page_size, (page - 1) * page_size)
+)
+st.dataframe(
+    data,
+    use_container_width=True,
+    column_config={
+        "image_link": st.column_config.ImageColumn("cover"),
+        "buy_link": st.column_config.LinkColumn("buy")
+    }
+)
+st.download_button("Download all books (CSV)", export_csv(), file_name="books.csv", mime="text/csv")
 
-# Display each book's details and image
-for idx, row in data.iterrows():
+# Drill into a single book on demand rather than rendering every one
+if len(data):
+    selected_title = st.selectbox("View details for", data["title"])
+    row = data.loc[data["title"] == selected_title].iloc[0]
     st.subheader(row["title"])
+    if row["image_link"]:
+        # Plain <img> with lazy/async hints lets the browser defer the
+        # thumbnail fetch instead of stalling the rerun on it
+        st.markdown(
+            f'<img src="{row["image_link"]}" width="150" loading="lazy" decoding="async">',
+            unsafe_allow_html=True
+        )
     st.write(f"**Authors**: {row['authors']}")
     st.write(f"**Description**: {row['description']}")
     st.write(f"**Categories**: {row['categories']}")
@@ -182,13 +440,5 @@ for idx, row in data.iterrows():
     st.write(f"**Average Rating**: {row['average_rating']} (based on {row['ratings_count']} ratings)")
     st.write(f"**Publisher**: {row['publisher']}")
     st.write(f"**Page Count**: {row['page_count']} pages")
-
-    # Show book image if available
-    if row['image_link']:
-        st.image(row['image_link'], width=150)
-
-    # Provide a buy link if available
-    if row['buy_link']:
+    if row["buy_link"]:
         st.write(f"[Buy the book here]({row['buy_link']})")
-
-    st.markdown("---")